@@ -1,199 +1,343 @@
 import psycopg2
+import psycopg2.extensions
 from psycopg2 import sql, errors
-from datetime import datetime
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import execute_values, NamedTupleCursor
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from decimal import Decimal, InvalidOperation
 import getpass
+import os
 import bcrypt
 import sys
 
+def _read_bcrypt_cost(default=12, minimum=10, maximum=31):
+    """Read BCRYPT_COST from the environment, clamped to bcrypt's usable range"""
+    value = os.environ.get('BCRYPT_COST', '').strip()
+    if not value:
+        return default
+    try:
+        cost = int(value)
+    except ValueError:
+        print(f"Ignoring invalid BCRYPT_COST {value!r}; using {default}")
+        return default
+    if not minimum <= cost <= maximum:
+        clamped = min(max(cost, minimum), maximum)
+        print(f"BCRYPT_COST {cost} is outside {minimum}..{maximum}; using {clamped}")
+        return clamped
+    return cost
+
+# bcrypt work factor for new hashes; each step down roughly doubles login/register
+# throughput. Existing hashes embed their own cost, so changing this never breaks
+# verification. Invalid values fall back to 12 and out-of-range ones are clamped to 10..31.
+BCRYPT_COST = _read_bcrypt_cost()
+
+# bcrypt releases the GIL while hashing, so new hashes run here in the background
+_HASH_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Hash of the development admin password (admin123), computed ahead of time at cost 10
+# so startup never runs bcrypt. Only seeded when SEED_ADMIN is set to a true value
+# (1/true/yes) and no user named admin exists yet; see README.md.
+ADMIN_SEED_HASH = "$2b$10$HPrVjsxBoKmKz8ZKogf1YeVwR.pWocBKF9cXGoREhR.8Os4lttDRK"
+SEED_ADMIN = os.environ.get('SEED_ADMIN', '').strip().lower() in ('1', 'true', 'yes')
+
+# Money columns are DECIMAL(10, 2); amounts are rounded to this before they reach SQL
+CENTS = Decimal('0.01')
+
+def parse_amount(text):
+    """Parse a positive money amount rounded to cents, raising ValueError otherwise"""
+    try:
+        amount = Decimal(text.strip())
+    except InvalidOperation:
+        raise ValueError(f"not a number: {text!r}")
+    # psycopg2 sends both Infinity and NaN as 'NaN'::numeric, so neither may reach SQL
+    if not amount.is_finite():
+        raise ValueError(f"not a finite amount: {text!r}")
+    amount = amount.quantize(CENTS)
+    if amount <= 0:
+        raise ValueError(f"amount must be positive: {text!r}")
+    return amount
+
+# Rows per page when an admin lists all loans
+LOANS_PAGE_SIZE = 50
+
+class PreparedConnection(psycopg2.extensions.connection):
+    """Connection that remembers which named statements it has prepared"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+    
+    def execute_prepared(self, cursor, name, params):
+        """Run a statement from PREPARED_STATEMENTS, preparing it on first use"""
+        if name not in self.prepared:
+            cursor.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+            self.prepared.add(name)
+        placeholders = ", ".join(["%s"] * len(params))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+
 class DatabaseConnection:
-    _instance = None
-    
-    def __new__(cls, dbname, user, password, host="localhost", port="5432"):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            try:
-                cls._instance.connection = psycopg2.connect(
-                    dbname=dbname,
-                    user=user,
-                    password=password,
-                    host=host,
-                    port=port
-                )
-                cls._instance.connection.autocommit = True
-            except psycopg2.OperationalError as e:
-                print(f"Failed to connect to database: {e}")
-                raise
-        return cls._instance
-    
-    def get_cursor(self):
-        return self.connection.cursor()
+    def __init__(self, dbname, user, password, host="localhost", port="5432", minconn=2, maxconn=10):
+        self._config = {
+            'dbname': dbname,
+            'user': user,
+            'password': password,
+            'host': host,
+            'port': port
+        }
+        try:
+            self._pool = ThreadedConnectionPool(
+                minconn=minconn,
+                maxconn=maxconn,
+                connection_factory=PreparedConnection,
+                cursor_factory=NamedTupleCursor,
+                **self._config
+            )
+        except psycopg2.OperationalError as e:
+            print(f"Failed to connect to database: {e}")
+            raise
+    
+    @contextmanager
+    def lease(self):
+        """Borrow a pooled connection as one transaction, returning it when done"""
+        conn = self._pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._pool.putconn(conn)
+    
+    @contextmanager
+    def autocommit(self):
+        """Open a dedicated autocommit connection outside the pool, e.g. for DDL"""
+        conn = psycopg2.connect(**self._config)
+        conn.autocommit = True
+        try:
+            yield conn
+        finally:
+            conn.close()
     
     def close(self):
-        if self.connection:
-            self.connection.close()
-            DatabaseConnection._instance = None
+        if self._pool:
+            self._pool.closeall()
+            self._pool = None
+
+def _from_row(cls, row):
+    """Build a model straight from a named-tuple row selected with its _COLS, bypassing __init__"""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(row._asdict())
+    return obj
 
 class User:
+    _COLS_TUPLE = ('user_id', 'username', 'password_hash', 'is_admin', 'created_at')
+    _COLS = ", ".join(_COLS_TUPLE)
+    
     def __init__(self, user_id, username, password_hash, is_admin=False, created_at=None):
         self.user_id = user_id
         self.username = username
-        self.password_hash = password_hash
+        self.password_hash = password_hash.encode('utf-8') if isinstance(password_hash, str) else password_hash
         self.is_admin = is_admin
         self.created_at = created_at
     
+    @classmethod
+    def from_row(cls, row):
+        """Build a user from a row, encoding the stored hash to bytes for bcrypt"""
+        obj = _from_row(cls, row)
+        obj.password_hash = obj.password_hash.encode('utf-8')
+        return obj
+    
+    @staticmethod
+    def hash_password(password):
+        """Start hashing a password on the worker pool and return a Future of the hash bytes"""
+        return _HASH_POOL.submit(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(BCRYPT_COST))
+    
     @classmethod
     def create(cls, username, password, is_admin=False):
-        """Hash password and create new user"""
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-        return cls(None, username, password_hash, is_admin)
+        """Start hashing the password in the background and create new user"""
+        return cls(None, username, cls.hash_password(password), is_admin)
+    
+    def _resolve_hash(self):
+        """Wait for a pending background hash, if any, and return the hash bytes"""
+        if isinstance(self.password_hash, Future):
+            self.password_hash = self.password_hash.result()
+        return self.password_hash
     
     def verify_password(self, password):
         """Verify password against stored hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        return bcrypt.checkpw(password.encode('utf-8'), self._resolve_hash())
     
     def save(self, db):
-        """Save user to database"""
-        with db.get_cursor() as cursor:
+        """Save user to database, returning False if the username is already taken"""
+        with db.lease() as conn, conn.cursor() as cursor:
             if self.user_id is None:
                 query = sql.SQL("""
                     INSERT INTO users (username, password_hash, is_admin)
                     VALUES (%s, %s, %s)
-                    RETURNING user_id
+                    ON CONFLICT (username) DO NOTHING
+                    RETURNING user_id, created_at
                 """)
-                cursor.execute(query, (self.username, self.password_hash, self.is_admin))
-                self.user_id = cursor.fetchone()[0]
+                cursor.execute(query, (self.username, self._resolve_hash().decode('utf-8'), self.is_admin))
+                result = cursor.fetchone()
+                if result is None:
+                    return False
+                self.user_id, self.created_at = result
             else:
                 query = sql.SQL("""
                     UPDATE users
                     SET username = %s, password_hash = %s, is_admin = %s
                     WHERE user_id = %s
                 """)
-                cursor.execute(query, (self.username, self.password_hash, self.is_admin, self.user_id))
+                cursor.execute(query, (self.username, self._resolve_hash().decode('utf-8'), self.is_admin, self.user_id))
+        return True
     
     @classmethod
     def get_by_username(cls, db, username):
         """Retrieve user by username"""
-        with db.get_cursor() as cursor:
-            query = sql.SQL("SELECT * FROM users WHERE username = %s")
-            cursor.execute(query, (username,))
+        with db.lease() as conn, conn.cursor() as cursor:
+            conn.execute_prepared(cursor, 'user_by_username', (username,))
             result = cursor.fetchone()
             if result:
-                return cls(*result)
+                return cls.from_row(result)
         return None
     
     @classmethod
     def get_by_id(cls, db, user_id):
         """Retrieve user by ID"""
-        with db.get_cursor() as cursor:
-            query = sql.SQL("SELECT * FROM users WHERE user_id = %s")
-            cursor.execute(query, (user_id,))
+        with db.lease() as conn, conn.cursor() as cursor:
+            conn.execute_prepared(cursor, 'user_by_id', (user_id,))
             result = cursor.fetchone()
             if result:
-                return cls(*result)
+                return cls.from_row(result)
         return None
 
 class Loan:
+    _COLS_TUPLE = ('loan_id', 'user_id', 'amount', 'term', 'interest_rate', 'status', 'created_at', 'current_balance')
+    _COLS = ", ".join(_COLS_TUPLE)
+    
     def __init__(self, loan_id, user_id, amount, term, interest_rate, status, created_at, current_balance):
         self.loan_id = loan_id
         self.user_id = user_id
-        self.amount = float(amount)
-        self.term = int(term)
-        self.interest_rate = float(interest_rate)
+        # Money columns stay Decimal as psycopg2 returns them
+        self.amount = amount
+        self.term = term
+        # interest_rate and current_balance are None until the database fills them on insert
+        self.interest_rate = interest_rate
         self.status = status  # 'pending', 'approved', 'rejected', 'paid'
         self.created_at = created_at
-        self.current_balance = float(current_balance)
+        self.current_balance = current_balance
+    
+    from_row = classmethod(_from_row)
     
     def save(self, db):
-        """Save loan to database"""
-        with db.get_cursor() as cursor:
+        """Save loan to database; interest rate and opening balance are set by the database"""
+        with db.lease() as conn, conn.cursor() as cursor:
             if self.loan_id is None:
                 query = sql.SQL("""
-                    INSERT INTO loans (user_id, amount, term, interest_rate, status, created_at, current_balance)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    RETURNING loan_id
+                    INSERT INTO loans (user_id, amount, term, status, created_at)
+                    VALUES (%s, %s, %s, %s, COALESCE(%s, CURRENT_TIMESTAMP))
+                    RETURNING loan_id, created_at, interest_rate, current_balance
                 """)
                 cursor.execute(query, (
                     self.user_id, self.amount, self.term, 
-                    self.interest_rate, self.status, 
-                    self.created_at, self.current_balance
+                    self.status, self.created_at
                 ))
-                self.loan_id = cursor.fetchone()[0]
+                self.loan_id, self.created_at, self.interest_rate, self.current_balance = cursor.fetchone()
             else:
-                query = sql.SQL("""
-                    UPDATE loans
-                    SET user_id = %s, amount = %s, term = %s, interest_rate = %s, 
-                        status = %s, created_at = %s, current_balance = %s
-                    WHERE loan_id = %s
-                """)
-                cursor.execute(query, (
+                conn.execute_prepared(cursor, 'loan_update', (
                     self.user_id, self.amount, self.term, 
-                    self.interest_rate, self.status, 
-                    self.created_at, self.current_balance,
-                    self.loan_id
+                    self.status, self.created_at, 
+                    self.current_balance, self.loan_id
                 ))
     
+    @classmethod
+    def save_many(cls, db, loans):
+        """Insert many new loans in a single round-trip"""
+        if not loans:
+            return
+        with db.lease() as conn, conn.cursor() as cursor:
+            rows = execute_values(cursor, """
+                INSERT INTO loans (user_id, amount, term, status, created_at)
+                VALUES %s
+                RETURNING loan_id, created_at, interest_rate, current_balance
+            """, [(l.user_id, l.amount, l.term, l.status, l.created_at) for l in loans],
+                template="(%s, %s, %s, %s, COALESCE(%s, CURRENT_TIMESTAMP))", fetch=True)
+            for loan, (loan_id, created_at, interest_rate, current_balance) in zip(loans, rows):
+                loan.loan_id = loan_id
+                loan.created_at = created_at
+                loan.interest_rate = interest_rate
+                loan.current_balance = current_balance
+    
     @classmethod
     def get_by_id(cls, db, loan_id):
         """Retrieve loan by ID"""
-        with db.get_cursor() as cursor:
-            query = sql.SQL("SELECT * FROM loans WHERE loan_id = %s")
-            cursor.execute(query, (loan_id,))
+        with db.lease() as conn, conn.cursor() as cursor:
+            conn.execute_prepared(cursor, 'loan_by_id', (loan_id,))
             result = cursor.fetchone()
             if result:
-                return cls(*result)
+                return cls.from_row(result)
         return None
     
     @classmethod
     def get_user_loans(cls, db, user_id):
         """Retrieve all loans for a user"""
-        with db.get_cursor() as cursor:
-            query = sql.SQL("SELECT * FROM loans WHERE user_id = %s ORDER BY created_at DESC")
-            cursor.execute(query, (user_id,))
-            return [cls(*row) for row in cursor.fetchall()]
+        with db.lease() as conn, conn.cursor() as cursor:
+            conn.execute_prepared(cursor, 'loans_by_user', (user_id,))
+            return [cls.from_row(row) for row in cursor.fetchall()]
+    
+    @classmethod
+    def get_user_loans_with_stats(cls, db, user_id):
+        """Retrieve loan summaries with payment totals for a user in one query"""
+        with db.lease() as conn, conn.cursor() as cursor:
+            conn.execute_prepared(cursor, 'loan_stats_by_user', (user_id,))
+            return cursor.fetchall()
     
-    def make_payment(self, db, amount):
-        """Process a payment against the loan"""
+    def make_payment(self, conn, amount):
+        """Process a payment against the loan within the caller's transaction"""
+        # Round first so the payoff check sees the same value the DECIMAL(10, 2) columns store
+        amount = Decimal(amount).quantize(CENTS)
         if amount <= 0:
             return False, "Payment amount must be positive"
         
-        if amount > self.current_balance:
-            return False, "Payment exceeds current balance"
+        payment = Payment.create(self.loan_id, amount)
         
-        self.current_balance -= amount
-        self.save(db)
-        
-
-        Payment.create(db, self.loan_id, amount).save(db)
-        
-        if self.current_balance == 0:
-            self.status = 'paid'
-            self.save(db)
+        with conn.cursor() as cursor:
+            # Balance check and decrement happen on the current row, not this object's copy
+            conn.execute_prepared(cursor, 'loan_apply_payment', (amount, self.loan_id))
+            result = cursor.fetchone()
+            if result is None:
+                return False, "Payment exceeds current balance or loan is not open for payment"
+            self.current_balance, self.status = result
+            
+            conn.execute_prepared(cursor, 'payment_insert', (payment.loan_id, payment.amount, payment.payment_date))
+            payment.payment_id, payment.payment_date = cursor.fetchone()
         
         return True, "Payment successful"
 
 class Payment:
+    _COLS_TUPLE = ('payment_id', 'loan_id', 'amount', 'payment_date')
+    _COLS = ", ".join(_COLS_TUPLE)
+    
     def __init__(self, payment_id, loan_id, amount, payment_date):
         self.payment_id = payment_id
         self.loan_id = loan_id
-        self.amount = float(amount)
+        self.amount = amount
         self.payment_date = payment_date
     
+    from_row = classmethod(_from_row)
+    
     @classmethod
-    def create(cls, db, loan_id, amount):
-        """Create a new payment record"""
-        return cls(None, loan_id, amount, datetime.now())
+    def create(cls, loan_id, amount):
+        """Create a new payment record; payment_date is filled by the database on save"""
+        return cls(None, loan_id, amount, None)
     
     def save(self, db):
         """Save payment to database"""
-        with db.get_cursor() as cursor:
+        with db.lease() as conn, conn.cursor() as cursor:
             if self.payment_id is None:
-                query = sql.SQL("""
-                    INSERT INTO payments (loan_id, amount, payment_date)
-                    VALUES (%s, %s, %s)
-                    RETURNING payment_id
-                """)
-                cursor.execute(query, (self.loan_id, self.amount, self.payment_date))
-                self.payment_id = cursor.fetchone()[0]
+                conn.execute_prepared(cursor, 'payment_insert', (self.loan_id, self.amount, self.payment_date))
+                self.payment_id, self.payment_date = cursor.fetchone()
             else:
                 query = sql.SQL("""
                     UPDATE payments
@@ -202,71 +346,152 @@ class Payment:
                 """)
                 cursor.execute(query, (self.loan_id, self.amount, self.payment_date, self.payment_id))
     
+    @classmethod
+    def save_many(cls, db, payments):
+        """Insert many new payments in a single round-trip"""
+        if not payments:
+            return
+        with db.lease() as conn, conn.cursor() as cursor:
+            rows = execute_values(cursor, """
+                INSERT INTO payments (loan_id, amount, payment_date)
+                VALUES %s
+                RETURNING payment_id, payment_date
+            """, [(p.loan_id, p.amount, p.payment_date) for p in payments],
+                template="(%s, %s, COALESCE(%s, CURRENT_TIMESTAMP))", fetch=True)
+            for payment, (payment_id, payment_date) in zip(payments, rows):
+                payment.payment_id = payment_id
+                payment.payment_date = payment_date
+    
     @classmethod
     def get_loan_payments(cls, db, loan_id):
         """Retrieve all payments for a loan"""
-        with db.get_cursor() as cursor:
-            query = sql.SQL("SELECT * FROM payments WHERE loan_id = %s ORDER BY payment_date DESC")
-            cursor.execute(query, (loan_id,))
-            return [cls(*row) for row in cursor.fetchall()]
+        with db.lease() as conn, conn.cursor() as cursor:
+            conn.execute_prepared(cursor, 'payments_by_loan', (loan_id,))
+            return [cls.from_row(row) for row in cursor.fetchall()]
+
+# Hot per-request statements, prepared server-side on first use per connection
+PREPARED_STATEMENTS = {
+    'user_by_username': f"SELECT {User._COLS} FROM users WHERE username = $1",
+    'user_by_id': f"SELECT {User._COLS} FROM users WHERE user_id = $1",
+    'loan_by_id': f"SELECT {Loan._COLS} FROM loans WHERE loan_id = $1",
+    'loans_by_user': f"SELECT {Loan._COLS} FROM loans WHERE user_id = $1 ORDER BY created_at DESC",
+    'loan_update': """
+        UPDATE loans
+        SET user_id = $1, amount = $2, term = $3,
+            status = $4, created_at = $5, current_balance = $6
+        WHERE loan_id = $7
+    """,
+    'loan_stats_by_user': """
+        SELECT l.loan_id, l.amount, l.current_balance, l.status,
+               COALESCE(SUM(p.amount), 0) AS paid, COUNT(p.payment_id) AS n_pay
+        FROM loans l
+        LEFT JOIN payments p ON p.loan_id = l.loan_id
+        WHERE l.user_id = $1
+        GROUP BY l.loan_id
+        ORDER BY l.created_at DESC
+    """,
+    'loan_apply_payment': """
+        UPDATE loans
+        SET current_balance = current_balance - $1,
+            status = CASE WHEN current_balance - $1 = 0 THEN 'paid' ELSE status END
+        WHERE loan_id = $2 AND status = 'approved' AND current_balance >= $1
+        RETURNING current_balance, status
+    """,
+    'payment_insert': """
+        INSERT INTO payments (loan_id, amount, payment_date)
+        VALUES ($1, $2, COALESCE($3::timestamp, CURRENT_TIMESTAMP))
+        RETURNING payment_id, payment_date
+    """,
+    'payments_by_loan': f"SELECT {Payment._COLS} FROM payments WHERE loan_id = $1 ORDER BY payment_date DESC",
+}
+
+SCHEMA_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        user_id SERIAL PRIMARY KEY,
+        username VARCHAR(50) UNIQUE NOT NULL,
+        password_hash VARCHAR(100) NOT NULL,
+        is_admin BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS loans (
+        loan_id SERIAL PRIMARY KEY,
+        user_id INTEGER REFERENCES users(user_id),
+        amount DECIMAL(10, 2) NOT NULL,
+        term INTEGER NOT NULL,
+        interest_rate DECIMAL(5, 2) NOT NULL,
+        status VARCHAR(20) DEFAULT 'pending',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        current_balance DECIMAL(10, 2) NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS payments (
+        payment_id SERIAL PRIMARY KEY,
+        loan_id INTEGER REFERENCES loans(loan_id),
+        amount DECIMAL(10, 2) NOT NULL,
+        payment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    # Interest rate follows the term, and a new loan opens with its full amount outstanding.
+    # A trigger rather than a generated column so tables created before this also get it.
+    """
+    CREATE OR REPLACE FUNCTION loans_fill_defaults() RETURNS trigger AS $$
+    BEGIN
+        NEW.interest_rate := LEAST(5.0 + NEW.term / 12.0, 15.0);
+        IF TG_OP = 'INSERT' THEN
+            NEW.current_balance := COALESCE(NEW.current_balance, NEW.amount);
+        END IF;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'loans_fill_defaults') THEN
+            CREATE TRIGGER loans_fill_defaults
+            BEFORE INSERT OR UPDATE OF term ON loans
+            FOR EACH ROW EXECUTE FUNCTION loans_fill_defaults();
+        END IF;
+    END
+    $$
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_loans_user_created ON loans (user_id, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_loans_status ON loans (status) WHERE status = 'pending'",
+    "CREATE INDEX IF NOT EXISTS idx_payments_loan_date ON payments (loan_id, payment_date DESC)",
+)
 
 class LoanApplicationSystem:
     def __init__(self, db_config):
         self.db = DatabaseConnection(**db_config)
         self.current_user = None
+        # Main menu entries shared by every logged-in user: choice -> (label, action)
+        self._actions = {
+            '1': ("Apply for Loan", self.apply_for_loan),
+            '2': ("Make a Payment", self.make_payment),
+            '3': ("Check Balance", self.check_balance),
+            '4': ("View Payment History", self.view_payment_history),
+        }
         self._initialize_database()
     
     def _initialize_database(self):
-        """Create tables if they don't exist"""
+        """Create tables and indexes if they don't exist"""
         try:
-            with self.db.get_cursor() as cursor:
-
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = 'users'
-                    )
-                """)
-                if not cursor.fetchone()[0]:
-
-                    cursor.execute("""
-                        CREATE TABLE users (
-                            user_id SERIAL PRIMARY KEY,
-                            username VARCHAR(50) UNIQUE NOT NULL,
-                            password_hash VARCHAR(100) NOT NULL,
-                            is_admin BOOLEAN DEFAULT FALSE,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-
-                    cursor.execute("""
-                        CREATE TABLE loans (
-                            loan_id SERIAL PRIMARY KEY,
-                            user_id INTEGER REFERENCES users(user_id),
-                            amount DECIMAL(10, 2) NOT NULL,
-                            term INTEGER NOT NULL,
-                            interest_rate DECIMAL(5, 2) NOT NULL,
-                            status VARCHAR(20) DEFAULT 'pending',
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            current_balance DECIMAL(10, 2) NOT NULL
-                        )
-                    """)
-                    
-                    cursor.execute("""
-                        CREATE TABLE payments (
-                            payment_id SERIAL PRIMARY KEY,
-                            loan_id INTEGER REFERENCES loans(loan_id),
-                            amount DECIMAL(10, 2) NOT NULL,
-                            payment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-                    admin = User.create("admin", "admin123", True)
-                    admin.save(self.db)
+            with self.db.autocommit() as conn, conn.cursor() as cursor:
+                # Idempotent DDL sent as one batch: a single round-trip on every start
+                cursor.execute(";".join(SCHEMA_DDL))
+            
+            if SEED_ADMIN:
+                # ON CONFLICT in User.save leaves an existing admin untouched
+                admin = User(None, "admin", ADMIN_SEED_HASH, True)
+                if admin.save(self.db):
                     print("Database initialized with admin user (username: admin, password: admin123)")
-                    
+            else:
+                print("No admin user seeded. Set SEED_ADMIN=1 to create admin/admin123 if none exists.")
+
         except Exception as e:
             print(f"Error initializing database: {e}")
             raise
@@ -288,19 +513,20 @@ class LoanApplicationSystem:
     def register(self):
         print("\n=== Register ===")
         username = input("Username: ")
-        if User.get_by_username(self.db, username):
-            print("Username already exists.")
-            return False
-        
         password = getpass.getpass("Password: ")
+        # Hash while the user types the confirmation; the result is dropped on a mismatch
+        password_hash = User.hash_password(password)
         confirm_password = getpass.getpass("Confirm Password: ")
         
         if password != confirm_password:
+            password_hash.cancel()
             print("Passwords do not match.")
             return False
         
-        user = User.create(username, password)
-        user.save(self.db)
+        user = User(None, username, password_hash)
+        if not user.save(self.db):
+            print("Username already exists.")
+            return False
         print("\nRegistration successful! Please login.")
         return True
     
@@ -311,22 +537,21 @@ class LoanApplicationSystem:
         
         print("\n=== Apply for Loan ===")
         try:
-            amount = float(input("Loan amount: "))
+            amount = parse_amount(input("Loan amount: "))
             term = int(input("Loan term (in months): "))
-            interest_rate = min(5.0 + (term / 12), 15.0)
             
             loan = Loan(
                 None, self.current_user.user_id, amount, term, 
-                interest_rate, 'pending', datetime.now(), amount
+                None, 'pending', None, None
             )
             loan.save(self.db)
             
             print(f"\nLoan application submitted successfully!")
             print(f"Amount: ${amount:.2f}")
             print(f"Term: {term} months")
-            print(f"Interest Rate: {interest_rate:.2f}%")
+            print(f"Interest Rate: {loan.interest_rate:.2f}%")
         except ValueError:
-            print("Invalid input. Please enter numbers only.")
+            print("Invalid input. Please enter a positive amount and a whole number of months.")
     
     def make_payment(self):
         if not self.current_user:
@@ -350,52 +575,52 @@ class LoanApplicationSystem:
                     print("This loan is not approved for payment.")
                     return
                 
-                amount = float(input("Payment amount: "))
-                success, message = loan.make_payment(self.db, amount)
+                amount = parse_amount(input("Payment amount: "))
+                with self.db.lease() as conn:
+                    success, message = loan.make_payment(conn, amount)
                 print(message)
             else:
                 print("Invalid selection.")
         except ValueError:
-            print("Invalid input. Please enter a number.")
+            print("Invalid input. Please enter a positive number.")
     
     def check_balance(self):
         if not self.current_user:
             print("Please login first.")
             return
         
-        loans = Loan.get_user_loans(self.db, self.current_user.user_id)
+        loans = Loan.get_user_loans_with_stats(self.db, self.current_user.user_id)
         if not loans:
             print("You have no active loans.")
             return
         
         print("\n=== Your Loan Balances ===")
         for loan in loans:
-            print(f"Loan ID: {loan.loan_id} | Original Amount: ${loan.amount:.2f} | Current Balance: ${loan.current_balance:.2f} | Status: {loan.status}")
+            print(f"Loan ID: {loan.loan_id} | Original Amount: ${loan.amount:.2f} | Current Balance: ${loan.current_balance:.2f} | Paid: ${loan.paid:.2f} ({loan.n_pay} payments) | Status: {loan.status}")
     
     def view_payment_history(self):
         if not self.current_user:
             print("Please login first.")
             return
         
-        loans = Loan.get_user_loans(self.db, self.current_user.user_id)
+        loans = Loan.get_user_loans_with_stats(self.db, self.current_user.user_id)
         if not loans:
             print("You have no active loans.")
             return
         
         print("\n=== Your Loans ===")
         for i, loan in enumerate(loans, 1):
-            print(f"{i}. Loan ID: {loan.loan_id} | Amount: ${loan.amount:.2f} | Balance: ${loan.current_balance:.2f}")
+            print(f"{i}. Loan ID: {loan.loan_id} | Amount: ${loan.amount:.2f} | Balance: ${loan.current_balance:.2f} | Payments: {loan.n_pay}")
         
         try:
             choice = int(input("\nSelect loan to view payment history (number): ")) - 1
             if 0 <= choice < len(loans):
                 loan = loans[choice]
-                payments = Payment.get_loan_payments(self.db, loan.loan_id)
-                
-                if not payments:
+                if loan.n_pay == 0:
                     print("No payments found for this loan.")
                     return
                 
+                payments = Payment.get_loan_payments(self.db, loan.loan_id)
                 print(f"\n=== Payment History for Loan {loan.loan_id} ===")
                 for payment in payments:
                     print(f"Date: {payment.payment_date} | Amount: ${payment.amount:.2f}")
@@ -423,9 +648,9 @@ class LoanApplicationSystem:
                 print("Invalid choice. Please try again.")
     
     def approve_loans(self):
-        with self.db.get_cursor() as cursor:
+        with self.db.lease() as conn, conn.cursor() as cursor:
             cursor.execute("""
-                SELECT l.*, u.username 
+                SELECT l.loan_id, l.amount, l.term, u.username
                 FROM loans l
                 JOIN users u ON l.user_id = u.user_id
                 WHERE l.status = 'pending'
@@ -438,53 +663,89 @@ class LoanApplicationSystem:
         
         print("\n=== Pending Loans ===")
         for i, loan in enumerate(pending_loans, 1):
-            print(f"{i}. Loan ID: {loan[0]} | User: {loan[8]} | Amount: ${loan[2]:.2f} | Term: {loan[3]} months")
+            print(f"{i}. Loan ID: {loan.loan_id} | User: {loan.username} | Amount: ${loan.amount:.2f} | Term: {loan.term} months")
         
         try:
-            choice = int(input("\nSelect loan to approve/reject (number): ")) - 1
-            if 0 <= choice < len(pending_loans):
-                loan_id = pending_loans[choice][0]
-                action = input("Approve (A) or Reject (R)? ").lower()
-                
-                if action == 'a':
-                    status = 'approved'
-                    message = "Loan approved successfully."
-                elif action == 'r':
-                    status = 'rejected'
-                    message = "Loan rejected."
-                else:
-                    print("Invalid action.")
-                    return
-                
-                with self.db.get_cursor() as cursor:
-                    cursor.execute("""
-                        UPDATE loans
-                        SET status = %s
-                        WHERE loan_id = %s
-                    """, (status, loan_id))
-                print(message)
-            else:
+            choices = [int(c) - 1 for c in input("\nSelect loans to approve/reject (numbers, comma-separated): ").split(',')]
+            if not all(0 <= choice < len(pending_loans) for choice in choices):
                 print("Invalid selection.")
+                return
+            loan_ids = [pending_loans[choice].loan_id for choice in choices]
+            
+            action = input("Approve (A) or Reject (R)? ").lower()
+            if action == 'a':
+                status = 'approved'
+                message = "Loans approved"
+            elif action == 'r':
+                status = 'rejected'
+                message = "Loans rejected"
+            else:
+                print("Invalid action.")
+                return
+            
+            # One statement for the whole batch; the status guard skips loans already decided
+            with self.db.lease() as conn, conn.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE loans
+                    SET status = %s
+                    WHERE loan_id = ANY(%s) AND status = 'pending'
+                    RETURNING loan_id
+                """, (status, loan_ids))
+                updated = [row[0] for row in cursor.fetchall()]
+            
+            if updated:
+                print(f"{message}: {', '.join(str(loan_id) for loan_id in updated)}")
+            else:
+                print("No loans were updated.")
         except ValueError:
-            print("Invalid input. Please enter a number.")
+            print("Invalid input. Please enter numbers separated by commas.")
     
     def view_all_loans(self):
-        with self.db.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT l.*, u.username 
-                FROM loans l
-                JOIN users u ON l.user_id = u.user_id
-                ORDER BY l.created_at DESC
-            """)
-            all_loans = cursor.fetchall()
-        
-        if not all_loans:
-            print("No loans found.")
-            return
-        
-        print("\n=== All Loans ===")
-        for loan in all_loans:
-            print(f"Loan ID: {loan[0]} | User: {loan[8]} | Amount: ${loan[2]:.2f} | Term: {loan[3]} months | Status: {loan[5]}")
+        last_id = None
+        shown = 0
+        while True:
+            # Keyset pagination on the non-null loan_id over a server-side cursor keeps
+            # only one page in memory; one extra row tells us whether another page exists
+            keyset = "WHERE l.loan_id < %s" if last_id is not None else ""
+            with self.db.lease() as conn, conn.cursor(name='all_loans_cur') as cursor:
+                cursor.itersize = LOANS_PAGE_SIZE + 1
+                cursor.execute(f"""
+                    SELECT l.loan_id, l.amount, l.term, l.status, u.username
+                    FROM loans l
+                    JOIN users u ON l.user_id = u.user_id
+                    {keyset}
+                    ORDER BY l.loan_id DESC
+                    LIMIT %s
+                """, (*(() if last_id is None else (last_id,)), LOANS_PAGE_SIZE + 1))
+                
+                page_rows = 0
+                has_more = False
+                for loan in cursor:
+                    if page_rows == LOANS_PAGE_SIZE:
+                        has_more = True
+                        break
+                    if shown == 0 and page_rows == 0:
+                        print("\n=== All Loans ===")
+                    print(f"Loan ID: {loan.loan_id} | User: {loan.username} | Amount: ${loan.amount:.2f} | Term: {loan.term} months | Status: {loan.status}")
+                    last_id = loan.loan_id
+                    page_rows += 1
+            
+            if shown == 0 and page_rows == 0:
+                print("No loans found.")
+                return
+            
+            shown += page_rows
+            if not has_more:
+                return
+            if input("\nShow more loans? (y/n): ").lower() != 'y':
+                return
+    
+    def _logout(self):
+        self.current_user = None
+        print("Logged out successfully.")
+    
+    def _invalid(self):
+        print("Invalid choice. Please try again.")
     
     def run(self):
         print("=== Loan Application System ===")
@@ -506,57 +767,21 @@ class LoanApplicationSystem:
                     print("Goodbye!")
                     break
                 else:
-                    print("Invalid choice. Please try again.")
+                    self._invalid()
             else:
                 if self.current_user.is_admin:
                     print("\n=== Main Menu (Admin) ===")
-                    print("1. Apply for Loan")
-                    print("2. Make a Payment") 
-                    print("3. Check Balance")
-                    print("4. View Payment History")
-                    print("5. Admin Functions")
-                    print("6. Logout")
-                    
-                    choice = input("Enter your choice: ")
-                    
-                    if choice == '1':
-                        self.apply_for_loan()
-                    elif choice == '2':
-                        self.make_payment()
-                    elif choice == '3':
-                        self.check_balance()
-                    elif choice == '4':
-                        self.view_payment_history()
-                    elif choice == '5':
-                        self.admin_menu()
-                    elif choice == '6':
-                        self.current_user = None
-                        print("Logged out successfully.")
-                    else:
-                        print("Invalid choice. Please try again.")
+                    menu = self._actions | {'5': ("Admin Functions", self.admin_menu), '6': ("Logout", self._logout)}
                 else:
                     print("\n=== Main Menu ===")
-                    print("1. Apply for Loan")
-                    print("2. Make a Payment")
-                    print("3. Check Balance")
-                    print("4. View Payment History")
-                    print("5. Logout")
-                    
-                    choice = input("Enter your choice: ")
-                    
-                    if choice == '1':
-                        self.apply_for_loan()
-                    elif choice == '2':
-                        self.make_payment()
-                    elif choice == '3':
-                        self.check_balance()
-                    elif choice == '4':
-                        self.view_payment_history()
-                    elif choice == '5':
-                        self.current_user = None
-                        print("Logged out successfully.")
-                    else:
-                        print("Invalid choice. Please try again.")
+                    menu = self._actions | {'5': ("Logout", self._logout)}
+                
+                for key, (label, _) in menu.items():
+                    print(f"{key}. {label}")
+                
+                choice = input("Enter your choice: ")
+                _, action = menu.get(choice, (None, self._invalid))
+                action()
 
 def get_database_config():
     """Get database configuration from user input"""